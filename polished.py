@@ -37,14 +37,18 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QSlider,
     QToolBar,
-    QVBoxLayout
+    QVBoxLayout,
+    QWidget
     )
 from PyQt6.QtCore import (
     Qt,
     QBasicTimer,
     QEvent,
+    QEventLoop,
     QPoint,
+    QPointF,
     QRect,
+    QRectF,
     QSettings,
     QSize,
     pyqtSignal
@@ -54,7 +58,9 @@ from PyQt6.QtGui import (
     QFont,
     QIcon,
     QPainter,
-    QPixmap
+    QPixmap,
+    QStaticText,
+    QTransform
     )
 from PyQt6.QtMultimedia import QSoundEffect
 from PyQt6.QtCore import QUrl
@@ -62,6 +68,9 @@ from PyQt6.QtTest import QTest # for qWait
 import typing
 import random
 import enum
+import functools
+import collections
+import operator
 
 '''
 
@@ -75,7 +84,7 @@ Name the seven Tetronimoes via an IntEnum. Note that 'O', 'I', 'T' and so
 forth are the standardized names for the shapes, per the tetris wiki.
 
 The 'N' Tetronimo is the non-shape that appears in any empty cell of the
-board. Only one 'N' is ever instantiated, as the global NO_T_mo.
+board. Only one 'N' is ever used, the global NO_T_mo.
 
 '''
 class T_ShapeNames(enum.IntEnum):
@@ -183,27 +192,80 @@ T_Shapes = {
     T_ShapeNames.S : ((1,-1),(0,-1),(0,0),(-1,0)),
     T_ShapeNames.Z : ((-1,-1),(0,-1),(0,0),(1,0))
     }
+'''
+
+=== Precomputed Rotations
+
+Each shape has only four orientations, so rather than apply the rotation
+comprehension every time a piece turns, we apply it once here. T_Rotations
+is keyed by (shape name, rotation), where rotation 0 is the spawn orientation
+from T_Shapes, and each higher number is one more turn to the right
+(clockwise). A left turn from rotation k is rotation (k-1)%4.
+
+'''
+def make_rotations() -> typing.Dict[typing.Tuple[T_ShapeNames,int], tuple] :
+    rotations = dict()
+    for t_name, coords in T_Shapes.items():
+        for rotation in range(4):
+            rotations[(t_name, rotation)] = coords
+            coords = tuple( ((-r,c) for (c,r) in coords) )
+    return rotations
+
+T_Rotations = make_rotations()
 
 '''
 
 === Tetronimo Class Definition (T_mo)
 
-A Tetronimo knows its shape name and color, and its current shape in terms of
-a tuple of the four (c,r) values of each of its cells, initialized from
-T_Shapes above.
+A Tetronimo knows its shape name and color, its rotation (0-3), and its
+current shape in terms of a tuple of the four (c,r) values of each of its
+cells, taken from T_Rotations above.
 
 A T_mo can rotate, but note that the `rotate_left()` and `rotate_right()`
-methods do _not_ modify the shape of the "self" T_mo! They return a _new_
-T_mo intended to replace this one. This is done so that the game can test a
-rotation. If the new, rotated T_mo is legal, it will replace the old; but if
-it it collides with something, the original T_mo can be left unchanged.
+methods do _not_ modify the shape of the "self" T_mo! They return a
+_different_ T_mo intended to replace this one. This is done so that the game
+can test a rotation. If the new, rotated T_mo is legal, it will replace the
+old; but if it it collides with something, the original T_mo can be left
+unchanged.
+
+Since a T_mo never changes after it is made, there is no need for more than
+one of each shape and rotation. All 32 of them (8 shapes including N, times 4
+rotations) are made once, below, and kept in T_MOS. Code outside this section
+should not call T_mo() but get a piece with `get_tmo()`, and rotating a piece
+returns another member of T_MOS. So moving and rotating pieces never
+allocates anything.
+
+With only 32 instances, __slots__ hardly saves memory, but it makes
+attribute access a little quicker, and T_mo attributes are read a great
+deal in testAndPlace() and paintEvent().
 
 '''
 class T_mo(object):
-    def __init__(self, t_name: T_ShapeNames) :
+    __slots__ = ('t_name', 't_color', 'rotation', 'coords',
+                 'c_min', 'c_max', 'r_min', 'r_max', 'col_masks')
+
+    def __init__(self, t_name: T_ShapeNames, rotation:int = 0) :
         self.t_name = t_name
         self.t_color = T_Colors[t_name]
-        self.coords = tuple( ((c,r) for (c,r) in T_Shapes[t_name]) )
+        self.rotation = rotation
+        self.coords = T_Rotations[(t_name, rotation)]
+        '''
+        The minimum and maximum c and r values of this T_mo. These are used
+        to test it against the walls of a board, and a T_mo never changes,
+        so they are worked out once here.
+        '''
+        self.c_min = min(c for (c,r) in self.coords)
+        self.c_max = max(c for (c,r) in self.coords)
+        self.r_min = min(r for (c,r) in self.coords)
+        self.r_max = max(r for (c,r) in self.coords)
+        '''
+        The T_mo's cells as column bitmasks, for testing against the board's
+        col_bits: for each column c from c_min to c_max, a mask with bit
+        (r - r_min) set for each of its cells (c,r) in that column.
+        '''
+        self.col_masks = tuple(
+            (dc, sum(1 << (r - self.r_min) for (c,r) in self.coords if c == dc))
+            for dc in range(self.c_min, self.c_max + 1) )
 
     def color(self) -> QColor :
         return self.t_color
@@ -217,44 +279,91 @@ class T_mo(object):
         return self.coords[cell][1]
 
     '''
-    Return the minimum and maximum r and c values of this T_mo. These are
-    used to compute collisions.
-    TODO: NOT USED ELIMINATE?
-    '''
-    #def r_max(self) -> int :
-        #return max( (r for (c,r) in self.coords) )
-    #def r_min(self) -> int :
-        #return min( (r for (c,r) in self.coords) )
-    #def c_max(self) -> int :
-        #return max( (c for (c,r) in self.coords) )
-    #def c_min(self) -> int :
-        #return min( (c for (c,r) in self.coords) )
-
-    '''
-    Return a new T_mo with its shape rotated either left or right.
-
-    Just in case at some point we need to sub-class the T_mo, we create the
-    new object using type(self)() instead of naming the class explicitly.
+    Return the T_mo of this shape rotated either left or right. It is
+    looked up in T_MOS, not computed.
     '''
     def rotateLeft(self) -> T_mo:
-        new_tmo = type(self)( self.t_name )
-        new_tmo.coords = tuple( ((r,-c) for (c,r) in self.coords ) )
-        return new_tmo
+        return T_MOS[(self.t_name, (self.rotation - 1) % 4)]
     def rotateRight(self) -> T_mo :
-        new_tmo = type(self)( self.t_name )
-        new_tmo.coords = tuple( ((-r,c) for (c,r) in self.coords ) )
-        return new_tmo
+        return T_MOS[(self.t_name, (self.rotation + 1) % 4)]
+
+T_MOS = { key : T_mo(*key) for key in T_Rotations }
+'''
+Return the one T_mo of a given shape and rotation; by default, the shape
+in its spawn orientation.
+'''
+def get_tmo(t_name: T_ShapeNames, rotation:int = 0) -> T_mo :
+    return T_MOS[(t_name, rotation)]
+'''
+
+=== Wall Kicks
+
+When a rotated piece will not fit where it is, the guidelines' "Super
+Rotation System" (SRS) lets the game try it at up to four other nearby
+places before giving up. The places to try depend on the rotation being
+made, from one rotation number to another, and are the same for the J, L, S,
+T and Z; the I has its own table. The O does not kick.
+
+The tables below are those of the tetris wiki (SRS page), with each offset
+written as (c,r). The wiki gives them as (x,y) with y increasing upward; our
+rows increase downward, so every y value has had its sign changed. The first
+offset of each list is (0,0), the unkicked position.
+
+Note that our pieces do not turn about exactly the same points as in SRS
+(the I, for one, turns about one of its cells, not its middle), so the kicks
+do not reproduce SRS to the letter. They do give the same effect, that a
+piece jammed against a wall or the stack can usually still be turned.
+
+'''
+SRS_Kicks_JLSTZ = {
+    (0,1) : ((0,0),(-1,0),(-1,-1),(0,2),(-1,2)),
+    (1,0) : ((0,0),(1,0),(1,1),(0,-2),(1,-2)),
+    (1,2) : ((0,0),(1,0),(1,1),(0,-2),(1,-2)),
+    (2,1) : ((0,0),(-1,0),(-1,-1),(0,2),(-1,2)),
+    (2,3) : ((0,0),(1,0),(1,-1),(0,2),(1,2)),
+    (3,2) : ((0,0),(-1,0),(-1,1),(0,-2),(-1,-2)),
+    (3,0) : ((0,0),(-1,0),(-1,1),(0,-2),(-1,-2)),
+    (0,3) : ((0,0),(1,0),(1,-1),(0,2),(1,2))
+    }
+SRS_Kicks_I = {
+    (0,1) : ((0,0),(-2,0),(1,0),(-2,1),(1,-2)),
+    (1,0) : ((0,0),(2,0),(-1,0),(2,-1),(-1,2)),
+    (1,2) : ((0,0),(-1,0),(2,0),(-1,-2),(2,1)),
+    (2,1) : ((0,0),(1,0),(-2,0),(1,2),(-2,-1)),
+    (2,3) : ((0,0),(2,0),(-1,0),(2,-1),(-1,2)),
+    (3,2) : ((0,0),(-2,0),(1,0),(-2,1),(1,-2)),
+    (3,0) : ((0,0),(1,0),(-2,0),(1,2),(-2,-1)),
+    (0,3) : ((0,0),(-1,0),(2,0),(-1,-2),(2,1))
+    }
+SRS_Kicks_O = { key : ((0,0),) for key in SRS_Kicks_JLSTZ }
+'''
+Select the kick table for each shape name.
+'''
+Wall_Kicks = {
+    T_ShapeNames.O : SRS_Kicks_O,
+    T_ShapeNames.I : SRS_Kicks_I,
+    T_ShapeNames.T : SRS_Kicks_JLSTZ,
+    T_ShapeNames.L : SRS_Kicks_JLSTZ,
+    T_ShapeNames.J : SRS_Kicks_JLSTZ,
+    T_ShapeNames.S : SRS_Kicks_JLSTZ,
+    T_ShapeNames.Z : SRS_Kicks_JLSTZ
+    }
 
 '''
 
 === Global "N" T_mo
 
-This global instance of T_mo is the only one of an 'N' tetronimo. It is
-referenced from any unoccupied board cell, giving empty cells their color.
-Thus `x is NO_T_mo` is the test for an empty cell.
+This global name refers to the 'N' tetronimo, the only one ever used. It
+stands for an unoccupied board cell, giving empty cells their color. Thus
+`x is NO_T_mo` is the test for an empty cell.
 
 '''
-NO_T_mo = T_mo( T_ShapeNames.N )
+NO_T_mo = get_tmo( T_ShapeNames.N )
+'''
+A Board stores only the shape name of each cell (see below). When a caller
+asks for the T_mo in a cell, this tuple, indexed by shape name, supplies one.
+'''
+Cell_T_mos = tuple( get_tmo(t_name) for t_name in T_ShapeNames )
 '''
 
 == The Board
@@ -265,9 +374,10 @@ the Board for the preview is smaller.
 
 The cells are drawn during a paint event, and the `paintEvent()` method and
 its subroutines are the bulk of the Board logic. Each cell of a Board
-contains only a reference to a T_mo. The color of that T_mo is the color of
-the cell. Empty cells all refer to the global `NO_T_mo` and so are drawn with
-a light gray color.
+contains only the T_ShapeNames value of the T_mo that filled it, stored as
+one byte in a `bytearray`. The color of that shape is the color of the cell.
+Empty cells hold T_ShapeNames.N, which is zero, and so are drawn with a light
+gray color.
 
 The Board keeps a reference to a "current" T_mo. On the main board this is
 the T_mo that the user is controlling. During a paintEvent, this T_mo is
@@ -298,7 +408,8 @@ returns one of three values,
     current piece, replacing it.
 
   * Board.TOUCH when a cell of the T_mo overlaps a cell that is not
-    empty. (This is tested before the following tests.)
+    empty, or is above the top or below the bottom of the board. (This is
+    tested after the following tests.)
 
   * Board.LEFT when a cell of the current T_mo would fall outside the left
     board margin.
@@ -361,7 +472,8 @@ class Board(QFrame):
         self.rows = rows
         self.cols = columns
         self.aspect = rows/columns
-        self.setStyleSheet( Board.board_style.format(0,0,0,0) )
+        self._margins = (0,0,0,0) # top, right, bottom, left padding in effect
+        self.setStyleSheet( Board.board_style.format(*self._margins) )
         '''
         Set the size policy so we cannot shrink below 10px per cell, but can
         grow. Any change will be preceded by a resize event; see
@@ -372,10 +484,30 @@ class Board(QFrame):
         sp = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
         self.setSizePolicy(sp)
         '''
-        The board contents is rows*columns cells, each referring to a T_mo.
+        The board contents is rows*columns cells, each holding the shape
+        name of a T_mo as one byte. A bytearray is compact, and zero (N) means
+        empty, so a cell can be tested simply for truth.
+
+        Alongside the cells we keep the same occupancy two ways, as int
+        bitmasks. Bit c of row_bits[r] is 1 when cell (r,c) is not empty; a
+        row whose mask is zero need not be painted. Bit r of col_bits[c] is
+        also 1 when cell (r,c) is not empty. ANDing the column masks gives
+        the full rows in one pass of cols operations (see winnow()), and the
+        lowest bit set in a column's mask is its highest non-empty cell (see
+        landingRow()).
         '''
         self.size = rows*columns
-        self.cells = [] # type: List[T_mo]
+        self.cells = bytearray()
+        self.row_bits = [] # type: List[int]
+        self.col_bits = [] # type: List[int]
+        '''
+        An image of the settled cells -- every cell of the board but the
+        current piece -- drawn at the current cell size, and a flag that is
+        False when the cells have changed in a way that means it must be made
+        again. See makeSettledPixmap().
+        '''
+        self._settled = QPixmap()
+        self._settled_ok = False
         self.clear() # populate the board with empty cells
         '''
         These slots hold info about the current piece, if any.
@@ -383,6 +515,20 @@ class Board(QFrame):
         self._current = NO_T_mo # type: T_mo
         self._col = 0
         self._row = 0
+        '''
+        Cache of one pre-drawn cell image per T_mo shape name, and the
+        (width,height) in pixels they were drawn at. See makeCellPixmaps().
+        '''
+        self._cell_pixmaps = {} # type: Dict[T_ShapeNames, QPixmap]
+        self._pixmap_size = (0,0)
+        '''
+        The contents rectangle and the pixel size of a cell are noted by
+        noteCellSize() on every resize, but pieceRect() may need them before
+        the first one.
+        '''
+        self.cells_rect = QRect()
+        self.cell_width = 0
+        self.cell_height = 0
 
     '''
     Clear the board to empty cells, at initialization and when the game is
@@ -392,8 +538,11 @@ class Board(QFrame):
         self._current = NO_T_mo
         self._col = 0
         self._row = 0
-        self.cells = [NO_T_mo]*self.size
-        self.update( self.contentsRect() ) # forces a paint event
+        self.cells = bytearray(self.size)
+        self.row_bits = [0]*self.rows
+        self.col_bits = [0]*self.cols
+        self._settled_ok = False
+        self.update() # forces a paint event of the whole widget
     '''
     Return the current piece or its location
     '''
@@ -404,15 +553,61 @@ class Board(QFrame):
     def currentRow(self) -> int:
         return self._row
     '''
-    Return the T_mo in our array at a given row and column.
+    Return a T_mo of the shape in our array at a given row and column; for
+    an empty cell, that is NO_T_mo.
     '''
     def shapeInCell(self,row:int,col:int) -> T_mo:
-        return self.cells[row*self.cols + col]
+        return Cell_T_mos[self.cells[row*self.cols + col]]
     '''
-    Set the cell at a given row and column to contain the given T_mo.
+    Set the cell at a given row and column to the shape of the given T_mo,
+    and keep the occupancy bits of that cell in step with it.
     '''
     def setCell(self, row:int, col:int, shape:T_mo) :
-        self.cells[row*self.cols + col] = shape
+        self.cells[row*self.cols + col] = shape.t_name
+        self._settled_ok = False
+        if shape is NO_T_mo :
+            self.row_bits[row] &= ~(1 << col)
+            self.col_bits[col] &= ~(1 << row)
+        else :
+            self.row_bits[row] |= (1 << col)
+            self.col_bits[col] |= (1 << row)
+    '''
+    Move every row of the board up by n rows. The top n rows are lost, and
+    n empty rows appear at the bottom. The current piece is not moved. The
+    preview display uses this to advance its queue of pieces.
+    '''
+    def shiftRowsUp(self, n:int) :
+        cut = n*self.cols
+        self.cells = self.cells[cut:] + bytearray(cut)
+        self.row_bits = self.row_bits[n:] + [0]*n
+        self.col_bits = [bits >> n for bits in self.col_bits]
+        self._settled_ok = False
+        self.update()
+    '''
+    ==== Landing Row
+
+    Return the row at which the current piece would come to rest if it were
+    dropped straight down, or None when that can't be worked out from the
+    column heights alone.
+
+    Each cell (c,r) of the piece can fall until it sits just above the
+    highest non-empty cell of its column, so the piece as a whole can fall to
+    the least of top-r-1, where top is the row of that highest cell (or rows
+    for an empty column). The highest cell is the lowest bit set in the
+    column's mask: bits & -bits isolates that bit. That holds only while
+    every cell of the piece is above its column's highest cell. A piece that
+    has been slid under an overhang is not, and then we return None; the
+    caller must step it down with testAndPlace().
+    '''
+    def landingRow(self) -> typing.Optional[int] :
+        landing = self.rows
+        for (c, r) in self._current.coords :
+            bits = self.col_bits[self._col + c]
+            top = (bits & -bits).bit_length() - 1 if bits else self.rows
+            if top <= self._row + r :
+                return None
+            landing = min(landing, top - r - 1)
+        return landing
 
     '''
     ==== Test and Place
@@ -431,34 +626,65 @@ class Board(QFrame):
     by saving the T_mo and its coordinates as the current piece, replacing
     the previous current piece.
 
-    After accepting a change we call QWidget.repaint(), to force a call to
-    paintEvent() so that the piece is seen to descend.
+    After accepting a change we call QWidget.update(), which schedules a call
+    to paintEvent() the next time control returns to the event loop. Unlike
+    repaint(), update() does not paint on the spot, and Qt merges any number
+    of pending updates into a single paint. So a caller that makes several
+    moves in a row (a hard drop, for one) must not expect to see each step
+    drawn; only the final position is painted.
+
+    Only the cells the piece has left and the cells it now covers need to be
+    drawn again, so the update is limited to the rectangle that encloses
+    both the old and new positions (see pieceRect() below).
+
+    The walls are tested first, using the T_mo's precomputed extrema. Then
+    the T_mo's column masks, shifted down to the new row, are ANDed with
+    the board's column masks: any bit in common is a cell already occupied.
+    That is one AND per column the piece spans (at most four), and no look
+    at the cells array at all.
     '''
 
     def testAndPlace(self, new_piece:T_mo, new_row:int, new_col:int) ->int :
         #print('t&p at r{} c{} ->'.format(new_row,new_col), end=' ')
-        for i in range(4):
-            r = new_row + new_piece.r(i)
-            c = new_col + new_piece.c(i)
-            if c < 0 :
-                #print('left')
-                return Board.LEFT
-            elif c >= self.cols:
-                #print('right')
-                return Board.RIGHT
-            elif r < 0 \
-            or r >= self.rows \
-            or self.shapeInCell(row=r,col=c) is not NO_T_mo:
+        cols = self.cols
+        if new_col + new_piece.c_min < 0 :
+            #print('left')
+            return Board.LEFT
+        if new_col + new_piece.c_max >= cols :
+            #print('right')
+            return Board.RIGHT
+        if new_row + new_piece.r_min < 0 \
+        or new_row + new_piece.r_max >= self.rows :
+            #print('touch')
+            return Board.TOUCH
+        col_bits = self.col_bits
+        shift = new_row + new_piece.r_min
+        for (dc, mask) in new_piece.col_masks :
+            if col_bits[new_col + dc] & (mask << shift) :
                 #print('touch')
                 return Board.TOUCH
 
         # It fits, place it
         #print('ok')
+        old_rect = self.pieceRect(self._current, self._row, self._col)
         self._current = new_piece
         self._row = new_row
         self._col = new_col
-        self.repaint()
+        self.update(old_rect.united(self.pieceRect(new_piece, new_row, new_col)))
         return Board.OK
+    '''
+    Return the rectangle, in widget pixels, that encloses the cells of a
+    given T_mo at a given row and column. For NO_T_mo, which is never drawn,
+    the rectangle is empty.
+    '''
+    def pieceRect(self, piece:T_mo, row:int, col:int) -> QRect :
+        if piece is NO_T_mo :
+            return QRect()
+        rect = self.cells_rect
+        return QRect(rect.left() + (col + piece.c_min) * self.cell_width,
+                     rect.top() + (row + piece.r_min) * self.cell_height,
+                     (piece.c_max - piece.c_min + 1) * self.cell_width,
+                     (piece.r_max - piece.r_min + 1) * self.cell_height)
 
     '''
     ==== Planting a piece
@@ -466,10 +692,30 @@ class Board(QFrame):
     The current T_mo has reached its final resting place. Install it into the
     board cells so they will show its color and no longer appear empty to
     testAndPlace().
+
+    This does what setCell() does for each cell, but written out, since a
+    planted piece never empties a cell. For the same reason the image of the
+    settled cells need not be made again: the four new cells are simply
+    drawn into it. No update is needed, as the piece is already on screen.
     '''
     def plant(self):
+        t_name = self._current.t_name
+        cols = self.cols
+        cells = self.cells
+        row_bits = self.row_bits
+        col_bits = self.col_bits
+        painter = QPainter(self._settled) if self._settled_ok else None
         for (c,r) in self._current.coords:
-            self.setCell(row=r+self._row, col=c+self._col, shape=self._current)
+            row = r + self._row
+            col = c + self._col
+            cells[row*cols + col] = t_name
+            row_bits[row] |= (1 << col)
+            col_bits[col] |= (1 << row)
+            if painter is not None :
+                painter.drawPixmap(col * self.cell_width, row * self.cell_height,
+                                   self._cell_pixmaps[t_name])
+        if painter is not None :
+            painter.end()
     '''
     ==== Collecting filled rows
 
@@ -482,35 +728,51 @@ class Board(QFrame):
     '''
     def winnow(self) -> int :
         '''
-        Step through the rows of the board and make a list of the row indices
-        of rows that are full, i.e. do not contain any NO_T_mo cells.
+        Make a list of the numbers of rows that are full, i.e. do not contain
+        any empty cells. A row is full when its bit is set in every column
+        mask, so AND them all together; the bits left set are the full rows.
         '''
-        full_rows = []
-        for row in range(0, len(self.cells), self.cols) :
-            if NO_T_mo in self.cells[row:row+self.cols] :
-                continue
-            full_rows.append(row)
+        filled = functools.reduce(operator.and_, self.col_bits)
+        full_rows = [row for row in range(self.rows) if filled & (1 << row)]
 
         if full_rows:
             '''
-            Full rows are deleted from the cells list. Do this from last
-            (higher index) to first (lower index) so as not to invalidate the
-            index of undeleted rows.
-            '''
-            for row in reversed(full_rows):
-                del self.cells[row:row+self.cols]
-            '''
-            Install an equal number of blank rows at the top, pushing existing
-            non-full rows down.
+            Rebuild the cells array and the row masks in one pass: an equal
+            number of blank rows at the top, followed by the rows that are not
+            full, in their existing order. That pushes the non-full rows down
+            and costs one copy of the board, rather than one reallocation per
+            deleted row.
 
             Note this means the "falling" of rows happens all at once. Some
             tetris games let the rows fall separately like bricks, and that
             would be nice.
             '''
-            new_rows = [NO_T_mo]*(len(full_rows)*self.cols)
-            self.cells = new_rows + self.cells
-            #self.update( self.contentsRect() ) # force a paint event
-            #self.repaint()
+            cols = self.cols
+            kept_rows = [row for row in range(self.rows)
+                         if not filled & (1 << row)]
+            n = len(full_rows)
+            self.cells = bytearray(n*cols) + b''.join(
+                self.cells[row*cols:(row+1)*cols] for row in kept_rows )
+            self.row_bits = [0]*n + [self.row_bits[row] for row in kept_rows]
+            '''
+            In each column mask, removing row r means the bits for the rows
+            above it (lower numbers) move down one place, and those below it
+            stay. Going from the top full row down, the rows below a full row
+            have not moved yet, so each full row is still at its old number.
+            '''
+            col_bits = self.col_bits
+            for row in full_rows:
+                above = (1 << row) - 1
+                below = ~(above | (1 << row))
+                col_bits = [(bits & below) | ((bits & above) << 1)
+                            for bits in col_bits]
+            self.col_bits = col_bits
+            '''
+            Every row above the lowest full one has moved, so let the whole
+            board be redrawn, from a new image of the settled cells.
+            '''
+            self._settled_ok = False
+            self.update()
 
         return len(full_rows)
     '''
@@ -523,67 +785,135 @@ class Board(QFrame):
     Note that the contents margins that may be set during a resize event to
     maintain the aspect ratio, are not painted here. Margins are painted by the
     containing widget.
+
+    Qt does not always want the whole widget redrawn. The rectangle it needs
+    is given by event.rect(), and anything drawn outside it is clipped away.
+    So we convert that rectangle to a range of rows and columns, and draw
+    only the cells in that range. When a piece moves one row, that is a
+    handful of cells instead of all 220.
+
+    Between one piece landing and the next, the only thing that changes is
+    the current piece. So all the other cells are kept drawn in an image
+    (see makeSettledPixmap() below), and a paint is one copy of the exposed
+    part of that image, plus the four cells of the current piece.
     '''
     def paintEvent(self, event):
-        rect = self.contentsRect()
-        # Note the pixel dimensions of one cell, for use in the drawCell method.
-        # cell_width SHOULD equal cell_height always, but don't assume it.
-        self.cell_width = rect.width() // self.cols
-        self.cell_height = rect.height() // self.rows
-
+        rect = self.cells_rect
+        exposed = event.rect()
+        v0 = max(0, (exposed.top() - rect.top()) // self.cell_height)
+        v1 = min(self.rows, (exposed.bottom() - rect.top()) // self.cell_height + 1)
+        h0 = max(0, (exposed.left() - rect.left()) // self.cell_width)
+        h1 = min(self.cols, (exposed.right() - rect.left()) // self.cell_width + 1)
+
+        if v0 >= v1 or h0 >= h1 :
+            return # exposed area is all margin
+        if not self._settled_ok :
+            self.makeSettledPixmap()
         painter = QPainter(self)
-
-        for v in range(self.rows):
-            for h in range(self.cols):
-                self.drawCell(painter,
-                                rect.left() + h * self.cell_width,
-                                rect.top() + v * self.cell_height,
-                                self.shapeInCell(row=v, col=h)
-                                )
+        source = QRect(h0 * self.cell_width, v0 * self.cell_height,
+                       (h1 - h0) * self.cell_width, (v1 - v0) * self.cell_height)
+        painter.drawPixmap(source.translated(rect.topLeft()), self._settled, source)
 
         if self._current is not NO_T_mo:
             '''
-            Draw the current tetronimo at its given location.
+            Draw the current tetronimo at its given location, in one call.
             '''
-            for i in range(4):
-                c = self._col + self._current.c(i)
-                r = self._row + self._current.r(i)
-                self.drawCell(painter,
-                                rect.left() + c * self.cell_width,
-                                rect.top() + r * self.cell_height,
-                                self._current
-                                )
-
-    '''
-    During a paint event (above) draw one cell of the board with the color of
-    the tetronimo that is in that cell. The T_mo knows its own QColor.
-    '''
-    def drawCell(self, painter:QPainter, x:int, y:int, shape:T_mo):
-        '''
-        First, paint a rectangle, inset 1 pixel from the cell boundary, in
-        the T_mo's color.
-        '''
-        color = shape.color()
-        painter.fillRect(x + 1,
-                         y + 1,
-                         self.cell_width - 2,
-                         self.cell_height - 2,
-                         color)
-
-        '''
-        Then, give the rectangle a "drop shadow" outline, lighter on top and
-        left sides and darker on bottom and right, using the very convenient
-        lighter/darker methods of the QColor class.
-        '''
-        painter.setPen(color.lighter())
-        painter.drawLine(x, y + self.cell_height - 1, x, y)
-        painter.drawLine(x, y, x + self.cell_width - 1, y)
-
-        painter.setPen(color.darker())
-        painter.drawLine(x + 1, y + self.cell_height - 1,
-                         x + self.cell_width - 1, y + self.cell_height - 1)
-        painter.drawLine(x + self.cell_width - 1, y + self.cell_height - 1,
-                         x + self.cell_width - 1, y + 1)
+            source = QRectF(0, 0, self.cell_width, self.cell_height)
+            painter.drawPixmapFragments(
+                [ self.cellFragment(rect, self._row + r, self._col + c, source)
+                  for (c,r) in self._current.coords ],
+                self._cell_pixmaps[self._current.t_name] )
+    '''
+    Make the image of all the settled cells of the board, at the current cell
+    size, for paintEvent(). This is called from paintEvent() when the flag
+    _settled_ok is False: after the board is cleared, a row is removed, a
+    cell is set, or the cell size changes.
+
+    Most cells are empty, so first cover the whole image with the empty-cell
+    image, in one call. Then collect the occupied cells, grouped by shape
+    name, as pixmap fragments; a row whose occupancy mask is zero has
+    nothing to add. Finally draw each group with its shape's cell image: one
+    call per color present, at most seven.
+    '''
+    def makeSettledPixmap(self):
+        w = self.cell_width
+        h = self.cell_height
+        pixmap = QPixmap(self.cols * w, self.rows * h)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.drawTiledPixmap(pixmap.rect(), self._cell_pixmaps[T_ShapeNames.N])
+
+        origin = pixmap.rect()
+        source = QRectF(0, 0, w, h)
+        fragments = dict() # type: typing.Dict[int, typing.List[QPainter.PixmapFragment]]
+        cells = self.cells
+        row_bits = self.row_bits
+        cols = self.cols
+        for v in range(self.rows):
+            if row_bits[v] :
+                row_start = v * cols
+                for c in range(cols):
+                    t_name = cells[row_start + c]
+                    if t_name :
+                        fragments.setdefault(t_name, []).append(
+                            self.cellFragment(origin, v, c, source) )
+        for t_name, frags in fragments.items():
+            painter.drawPixmapFragments(frags, self._cell_pixmaps[t_name])
+        painter.end()
+        self._settled = pixmap
+        self._settled_ok = True
+
+    '''
+    During painting (above) make the pixmap fragment that places one
+    cell image at row r, column c, in a rectangle whose top left is that of
+    cell (0,0). Every cell of a given shape looks the
+    same, so rather than drawing it from primitives each time, we copy in the
+    image prepared for that shape by makeCellPixmaps() (below). A fragment
+    is positioned by its center point.
+    '''
+    def cellFragment(self, rect:QRect, r:int, c:int, source:QRectF) -> QPainter.PixmapFragment :
+        return QPainter.PixmapFragment.create(
+            QPointF(rect.left() + (c + 0.5) * self.cell_width,
+                    rect.top() + (r + 0.5) * self.cell_height),
+            source)
+    '''
+    Prepare the cell images used by paintEvent(), one for each shape name, at
+    the current cell_width and cell_height. This is called from
+    noteCellSize() only when the cell size has changed.
+
+    The pixmaps begin fully transparent, because the empty-cell color
+    (that of NO_T_mo) is itself partly transparent.
+    '''
+    def makeCellPixmaps(self):
+        w = self.cell_width
+        h = self.cell_height
+        self._cell_pixmaps = {}
+        for t_name in T_ShapeNames:
+            pixmap = QPixmap(w, h)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            '''
+            First, paint a rectangle, inset 1 pixel from the cell boundary, in
+            the T_mo's color.
+            '''
+            color = T_Colors[t_name]
+            painter.fillRect(1, 1, w - 2, h - 2, color)
+            '''
+            Then, give the rectangle a "drop shadow" outline, lighter on top and
+            left sides and darker on bottom and right, using the very convenient
+            lighter/darker methods of the QColor class.
+            '''
+            painter.setPen(color.lighter())
+            painter.drawLine(0, h - 1, 0, 0)
+            painter.drawLine(0, 0, w - 1, 0)
+
+            painter.setPen(color.darker())
+            painter.drawLine(1, h - 1, w - 1, h - 1)
+            painter.drawLine(w - 1, h - 1, w - 1, 1)
+            painter.end()
+            self._cell_pixmaps[t_name] = pixmap
+        self._pixmap_size = (w, h)
+        self._settled_ok = False
     '''
     === Resize Event
 
@@ -638,9 +968,10 @@ class Board(QFrame):
                 add_left = adjust//2
                 add_right = adjust - add_left
                 #print('new left/right {}/{}'.format(add_left,add_right))
-                self.setStyleSheet(
-                    Board.board_style.format(0,add_right,0,add_left)
-                    )
+                self.setMargins( (0,add_right,0,add_left) )
+            else:
+                # near enough: drop any padding left from an earlier size
+                self.setMargins( (0,0,0,0) )
         else :
             '''
             Resized dimensions are ok or too tall. Pad the top and bottom
@@ -653,10 +984,111 @@ class Board(QFrame):
                 add_top = adjust//2
                 add_bottom = adjust-add_top
                 #print('new top/bottom {}/{}'.format(add_top,add_bottom))
-                self.setStyleSheet(
-                    Board.board_style.format(add_top,0,add_bottom,0)
-                    )
+                self.setMargins( (add_top,0,add_bottom,0) )
+            else:
+                self.setMargins( (0,0,0,0) )
         super().resizeEvent(event)
+        self.noteCellSize()
+    '''
+    Apply new padding (top, right, bottom, left) through the style sheet.
+    Setting a style sheet makes Qt re-parse it and re-polish the widget,
+    which is far from free, and during a drag most resizes come out with
+    the same padding as the one before. So do it only when the padding
+    actually changes.
+    '''
+    def setMargins(self, margins:typing.Tuple[int,int,int,int]):
+        if margins != self._margins :
+            self._margins = margins
+            self.setStyleSheet( Board.board_style.format(*margins) )
+    '''
+    Note the contents rectangle and the pixel dimensions of one cell, for use
+    by paintEvent() and pieceRect(). These change only when the size or the
+    padding of the board changes, both of which happen only in resizeEvent().
+    Remake the cell images if the cell size is new.
+
+    cell_width SHOULD equal cell_height always, but don't assume it.
+    '''
+    def noteCellSize(self):
+        self.cells_rect = self.contentsRect()
+        self.cell_width = self.cells_rect.width() // self.cols
+        self.cell_height = self.cells_rect.height() // self.rows
+        if self.cell_width > 0 and self.cell_height > 0 \
+        and self._pixmap_size != (self.cell_width, self.cell_height):
+            self.makeCellPixmaps()
+
+'''
+
+== The Score Display
+
+The four numbers at the left of the game (lines cleared, level, score and
+high score) are each shown in a ScoreDisplay. This is a sunken panel with
+one line of text centered in it, like a QLabel. The difference is that a
+QLabel lays out its text on every paint, while a ScoreDisplay keeps its
+text in a QStaticText, which is laid out once when the text is set and
+after that only drawn.
+
+Only the setText() and text() methods of QLabel are provided, plus
+setValue(), which the Game uses to show a number.
+
+'''
+
+class ScoreDisplay(QFrame):
+    def __init__(self, parent, font:QFont):
+        super().__init__(parent)
+        self.setFont(font)
+        self.setFrameShape(QFrame.Shape.Panel)
+        self.setLineWidth(2)
+        self.setFrameShadow(QFrame.Shadow.Sunken)
+        self.setMinimumWidth(80)
+        self.static_text = QStaticText()
+        self.value = 0
+        self.setText('0')
+    '''
+    Set new text, lay it out in our font, and schedule a paint. If the text
+    has changed length, its width may have too, so tell the layout to ask
+    for our sizeHint() again.
+    '''
+    def setText(self, text:str):
+        if len(text) != len(self.static_text.text()) :
+            self.updateGeometry()
+        self.static_text.setText(text)
+        self.static_text.prepare(QTransform(), self.font())
+        self.update()
+    def text(self) -> str:
+        return self.static_text.text()
+    '''
+    Show an integer. The timer sets the score many times a second, and
+    usually it has not changed, so compare the number to the one shown and
+    do nothing when it is the same.
+    '''
+    def setValue(self, value:int):
+        if value != self.value :
+            self.value = value
+            self.setText(str(value))
+    '''
+    Ask for room for the text plus the frame around it.
+    '''
+    def sizeHint(self) -> QSize :
+        metrics = self.fontMetrics()
+        frame = 2 * self.frameWidth()
+        return QSize(metrics.horizontalAdvance(self.text()) + frame,
+                     metrics.height() + frame)
+    def minimumSizeHint(self) -> QSize :
+        return self.sizeHint()
+    '''
+    QFrame.paintEvent() draws the sunken frame; then draw the text centered
+    in the contents rectangle.
+    '''
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        rect = self.contentsRect()
+        size = self.static_text.size()
+        painter.drawStaticText(
+            QPointF(rect.left() + (rect.width() - size.width()) / 2,
+                    rect.top() + (rect.height() - size.height()) / 2),
+            self.static_text)
 
 '''
 
@@ -689,6 +1121,94 @@ class Game(QFrame):
     and increasing the difficulty.
     '''
     TimeFactor = 0.875
+    '''
+    The game step time at each level, worked out once here rather than with
+    a power on every level change. It bottoms out at 20ms, which it reaches
+    before level 28; every level after the last in the table uses the last.
+    '''
+    StepTimes = []
+    for level in range(32):
+        StepTimes.append( max(20, int(StartingSpeed * (TimeFactor ** level))) )
+        if StepTimes[-1] == 20 : break
+    del level
+    '''
+    Points for clearing 1, 2, 3 or 4 lines at once, indexed by the number of
+    lines, before multiplying by one more than the level.
+    '''
+    LinePoints = (0, 100, 300, 500, 800)
+    '''
+    Size of the game board, and the row and column where each new piece
+    appears: row 1 (second from top) of the middle column. The shapes in
+    T_Shapes are all laid out around their (0,0) cell so that this one
+    position suits every piece.
+    '''
+    BoardRows = 22
+    BoardColumns = 10
+    SpawnRow = 1
+    SpawnColumn = BoardColumns // 2
+    '''
+    The O is the only shape with no cells above its (0,0) cell, so in the
+    preview display it sits one row higher than the others.
+    '''
+    PreviewRowOffset = { t_name : 0 for t_name in T_ShapeNames }
+    PreviewRowOffset[T_ShapeNames.O] = -1
+    '''
+    The seven playable pieces in spawn orientation, all but the N of
+    Cell_T_mos, for make_bag().
+    '''
+    BagPieces = Cell_T_mos[1:]
+    '''
+    The keypad modifier as an int, to be OR'd with a key code. See Define
+    Keystroke Actions below.
+    '''
+    KeypadBit = int(Qt.KeyboardModifier.KeypadModifier.value)
+    '''
+    The keys that command each action, as (method name, arguments, key
+    values) triples. These are the keys listed in "4.1 Table of Basic
+    Controls" in the Tetris guidelines. The names of keys and modifier codes
+    are defined in the Qt namespace, see doc.qt.io/qt-5/qt.html#Key-enum.
+
+    For simple recognition we take the keypad modifier, if it is present,
+    and OR it with the key code. Other modifiers are ignored. Key values are
+    the same for every game, so they are worked out once here; the Game
+    binds them to its own methods in Define Keystroke Actions below.
+
+    Note: on the macbook (at least) the arrow keys have the keypad bit
+    set. Don't know about other platforms, defining it both ways.
+    '''
+    KP = KeypadBit
+    Key = Qt.Key
+    KeyTable = (
+        ('moveSideways', (True,),
+            (int(Key.Key_Left), KP|int(Key.Key_Left), KP|int(Key.Key_4))),
+        ('moveSideways', (False,),
+            (int(Key.Key_Right), KP|int(Key.Key_Right), KP|int(Key.Key_6))),
+        ('dropDown', (),
+            (int(Key.Key_Space), KP|int(Key.Key_8))),
+        ('softDrop', (),
+            (int(Key.Key_D), KP|int(Key.Key_2))),
+        ('rotatePiece', (False,),
+            (int(Key.Key_Up), KP|int(Key.Key_Up), int(Key.Key_X),
+             KP|int(Key.Key_1), KP|int(Key.Key_5), KP|int(Key.Key_9))),
+        ('rotatePiece', (True,),
+            (int(Key.Key_Down), KP|int(Key.Key_Down), int(Key.Key_Z),
+             KP|int(Key.Key_3), KP|int(Key.Key_7))),
+        ('holdCurrentPiece', (),
+            (int(Key.Key_Shift), int(Key.Key_C), KP|int(Key.Key_0))),
+        ('pause', (),
+            (int(Key.Key_P), int(Key.Key_Escape), int(Key.Key_F1)))
+        )
+    del KP, Key
+    '''
+    Holding a key down makes the OS send it again and again, marked as an
+    auto-repeat. Following the guidelines, only moving sideways and soft
+    drop repeat. A repeated rotate, hard drop, hold or pause key is taken
+    and ignored, so a held Space doesn't slam piece after piece to the
+    bottom, each with a full test, plant and winnow.
+    '''
+    NoRepeatKeys = frozenset( key for (name, args, keys) in KeyTable
+        if name in ('rotatePiece', 'dropDown', 'holdCurrentPiece', 'pause')
+        for key in keys )
 
     '''
     === Game Initialization
@@ -703,16 +1223,32 @@ class Game(QFrame):
         self.high_score = high_score
         self.sfx = sfx_dict
         '''
+        The play() methods of the effects used during play are bound once
+        here, so that making a sound is one attribute fetch and a call,
+        not a dict lookup as well. The theme, which is also stopped, is
+        used through self.sfx.
+        '''
+        self.play_move = sfx_dict['move'].play
+        self.play_rotate = sfx_dict['rotate'].play
+        self.play_drop = sfx_dict['drop'].play
+        self.play_line = sfx_dict['line'].play
+        self.play_settle = sfx_dict['settle'].play
+        self.play_bonk = sfx_dict['bonk'].play
+        self.play_swap = sfx_dict['swap'].play
+        self.play_tetris = sfx_dict['tetris'].play
+        '''
         Direct all keystrokes seen by a contained widget, to this widget.
         '''
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         '''
         Create the timer that sets the pace of the game.
-        Create the timer interval, initially StartingSpeed.
+        Create the timer interval, initially StartingSpeed, and a note of
+        the interval the timer was last started with.
         Create the count of lines cleared.
         '''
         self.timer = QBasicTimer()
         self.timeStep = Game.StartingSpeed
+        self.timer_step = 0
         self.lines_cleared = 0
         '''
         Create the flag that is set True after clearing any complete lines,
@@ -732,83 +1268,22 @@ class Game(QFrame):
         preview pieces.
         '''
         self.bag_of_pieces = [] # Type: typing.List[T_mo]
-        self.preview_list = [] # Type: typing.List[T_mo]
-        '''
-        ==== Define Keystroke Constants
-
-        Create sets of accepted keys, for quick reference during a
-        keyPressEvent. The keys to be recognized are those listed in "4.1
-        Table of Basic Controls" in the Tetris guidelines.
-
-        The names of keys and modifier codes are defined in the Qt namespace,
-        see doc.qt.io/qt-5/qt.html#Key-enum. It defines key values as 32-bit ints with
-        some of the high bits zero. It defines the modifiers (Shift, Control, Alt etc)
-        as ints with single high bits set.
-
-        For simple recognition we take the modifier value and OR it with the
-        key code. Then we create a `set` of the key values that command each operation. If a key
-        is `in` that set, it commands that operation.
-
-        For speed we use `frozenset` which is just like `set` but can't be
-        added-to. The frozenset constructor requires an iterator as its
-        argument; we give it a tuple of expressions, each defining a relevant
-        keystroke. A downside of this is majorly nested parens!
-
-        Note: on the macbook (at least) the arrow keys have the keypad bit
-        set. Don't know about other platforms, defining it both ways.
-        '''
-        self.Keys_left = frozenset((
-            int(Qt.Key.Key_Left),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_Left),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_4)
-            ))
-        self.Keys_right = frozenset((
-            int(Qt.Key.Key_Right),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_Right),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_6)
-            ))
-        self.Keys_hard_drop = frozenset((
-            int(Qt.Key.Key_Space),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_8)
-            ))
-        self.Keys_soft_drop = frozenset((
-            int(Qt.Key.Key_D),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_2)
-            ))
-        self.Keys_clockwise = frozenset((
-            int(Qt.Key.Key_Up),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_Up),
-            int(Qt.Key.Key_X),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_1),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_5),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_9)
-            ))
-        self.Keys_widdershins = frozenset((
-            int(Qt.Key.Key_Down),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_Down),
-            int(Qt.Key.Key_Z),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_3),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_7)
-            ))
-        self.Keys_hold = frozenset((
-            int(Qt.Key.Key_Shift),
-            int(Qt.Key.Key_C),
-            int(Qt.KeyboardModifier.KeypadModifier.value)|int(Qt.Key.Key_0)
-            ))
-        self.Keys_pause = frozenset((
-            int(Qt.Key.Key_P),
-            int(Qt.Key.Key_Escape),
-            int(Qt.Key.Key_F1)
-            ))
-        '''
-        Now merge the sets of accepted keys into one set so we can make a
-        very fast "Do we handle this key?" test.
-        '''
-        self.validKeys = frozenset(
-            self.Keys_left | self.Keys_right | self.Keys_hard_drop | \
-            self.Keys_soft_drop | self.Keys_clockwise | \
-            self.Keys_widdershins | self.Keys_hold | self.Keys_pause
-            )
+        self.preview_list = collections.deque() # Type: typing.Deque[T_mo]
+        '''
+        ==== Define Keystroke Actions
+
+        Build a dict that maps each accepted keystroke to the method that
+        handles it, so a keyPressEvent needs only one lookup to decide both
+        whether we handle the key, and what to do. One pass over the class's
+        KeyTable fills it in.
+        '''
+        self.key_action = dict() # type: typing.Dict[int, typing.Callable[[], typing.Any]]
+        for (name, args, keys) in Game.KeyTable :
+            method = getattr(self, name)
+            if args :
+                method = functools.partial(method, *args)
+            for key in keys :
+                self.key_action[key] = method
         '''
         ==== Lay out the playing board
 
@@ -826,7 +1301,7 @@ class Game(QFrame):
 
         Create the game board.
         '''
-        self.board = Board(self,22,10)
+        self.board = Board(self,Game.BoardRows,Game.BoardColumns)
         '''
         Create the layout as an HBox. Give it left and right sublayouts
         and the game board in the center.
@@ -856,10 +1331,20 @@ class Game(QFrame):
         left_vb.addStretch(2)
         '''
         Create a grid layout for the four score numbers. Each row has a
-        QLabel for a caption, and QLabel to display the value. We keep a reference
+        QLabel for a caption, and a ScoreDisplay to display the value. We keep a reference
         to the latter so its text can be updated as needed.
+
+        The grid is installed in a plain QWidget, score_panel, so that when
+        several numbers change at once we can hold off its painting until
+        all are set. See setScores().
         '''
-        score_grid = QGridLayout()
+        self.score_panel = QWidget(self)
+        self.label_font = QFont()
+        self.label_font.setPointSize(16)
+        self.label_font.setBold(True)
+        self.label_font.setWeight(75)
+        score_grid = QGridLayout(self.score_panel)
+        score_grid.setContentsMargins(0,0,0,0)
 
         lines_caption = self.make_label('Lines Cleared')
         score_grid.addWidget(lines_caption, 0, 0, 1, 1)
@@ -881,7 +1366,7 @@ class Game(QFrame):
         self.high_display = self.make_label()
         score_grid.addWidget(self.high_display, 3, 1, 1, 1)
 
-        left_vb.addLayout(score_grid)
+        left_vb.addWidget(self.score_panel)
         '''
         Create a Board 5 rows wide by 15 rows high to display five
         preview pieces. Install it in the right VBox.
@@ -903,26 +1388,17 @@ class Game(QFrame):
 
     Take the job of creating a QLabel for caption or score out of line.
     Caption label has a text, and is a raised panel. Score label has no
-    text and is a sunken panel. Code taken from a QtCreator .uic file.
+    text, and is a ScoreDisplay (see above), which is a sunken panel. Code
+    taken from a QtCreator .uic file. All share the one font, self.label_font.
     '''
     def make_label(self,text:str = None):
+        if not text: # score
+            return ScoreDisplay(self, self.label_font)
         label = QLabel(self)
-        font = QFont()
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        label.setFont(font)
-        if text: # caption
-            #label.setFrameShadow(QFrame.Raised)
-            label.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
-            label.setText(text)
-        else:
-            label.setFrameShape(QFrame.Shape.Panel)
-            label.setLineWidth(2)
-            label.setFrameShadow(QFrame.Shadow.Sunken)
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setText('0')
-            label.setMinimumWidth(80)
+        label.setFont(self.label_font)
+        #label.setFrameShadow(QFrame.Raised)
+        label.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+        label.setText(text)
         return label
 
     '''
@@ -940,19 +1416,31 @@ class Game(QFrame):
         self.sfx['theme'].stop()
         self.timeStep = Game.StartingSpeed
         self.current_level = 0
-        self.level_display.setText('0')
         self.current_score = 0
-        self.score_display.setText('0')
-        self.high_display.setText(str(self.high_score))
         self.lines_cleared = 0
-        self.lines_display.setText('0')
+        self.setScores()
         self.held_piece = NO_T_mo
         self.held_display.clear()
         self.preview_display.clear()
         self.bag_of_pieces = self.make_bag()
-        self.preview_list = list(self.bag_of_pieces[0:5])
+        self.preview_list = collections.deque(self.bag_of_pieces[0:5], maxlen=5)
         self.bag_of_pieces = self.bag_of_pieces[5:]
-        self.update( self.contentsRect() ) # force a paint event
+        '''
+        The three boards and the score displays have each scheduled their own
+        paint, so there is no need to repaint the whole Game frame.
+        '''
+    '''
+    Show all four numbers in the score panel. Painting of the panel is
+    suspended while they are set, so it is painted once, with every number
+    new, rather than once for each.
+    '''
+    def setScores(self):
+        self.score_panel.setUpdatesEnabled(False)
+        self.lines_display.setValue(self.lines_cleared)
+        self.level_display.setValue(self.current_level)
+        self.score_display.setValue(self.current_score)
+        self.high_display.setValue(self.high_score)
+        self.score_panel.setUpdatesEnabled(True)
     '''
     === Play button
 
@@ -965,6 +1453,7 @@ class Game(QFrame):
         self.isStarted = True
         self.sfx['theme'].play()
         self.timer.start( self.timeStep, self )
+        self.timer_step = self.timeStep
         if self.board.currentPiece() is NO_T_mo :
             self.newPiece()
     '''
@@ -995,7 +1484,7 @@ class Game(QFrame):
         self.isOver = True
         if self.high_score < self.current_score :
             self.high_score = self.current_score
-            self.high_display.setText(str(self.high_score))
+            self.high_display.setValue(self.high_score)
             QMessageBox.information(self,'HUZZAH!','New high score!')
         # TODO: make appropriate sound
     '''
@@ -1007,48 +1496,60 @@ class Game(QFrame):
     droughts. With the bag system you never get more than two identical
     pieces in a row, or go longer than 12 before getting that I-piece that
     you are so desperate for.
+
+    The seven pieces are the shared T_mos of Game.BagPieces, so a bag is just
+    a random permutation of that tuple.
     '''
     def make_bag(self) -> typing.List[T_mo] :
-        bag = [ T_mo(T_ShapeNames(v)) for v in range(1,8) ]
-        random.shuffle(bag)
-        return bag
+        return random.sample(Game.BagPieces, 7)
     '''
     Return the next piece to play.
 
     The queue of next pieces begins in the preview_list, which is a FIFO
-    queue of five pieces. The piece to return is the top one in that queue.
+    queue of five pieces, a deque so that taking from the front doesn't
+    shift the rest. The piece to return is the top one in that queue.
     After removing it, we get the next piece from the "bag", refilling the
     bag if necessary. Then we replenish the preview list, and refresh the
     preview_display board.
+
+    Each preview piece fills two rows of a three-row slot. When the queue
+    advances, every piece moves up one slot, so rather than draw all five
+    again we shift the preview board up three rows and place only the new
+    piece in the bottom slot. The whole queue is drawn only when the preview
+    board is empty, after a clear().
     '''
     def nextPiece(self) -> T_mo:
-        next_piece = self.preview_list.pop(0)
+        next_piece = self.preview_list.popleft()
         if 0 == len(self.bag_of_pieces):
             self.bag_of_pieces = self.make_bag()
         self.preview_list.append(self.bag_of_pieces.pop())
-        '''
-        To refresh the preview display board, we first clear it. Then for each
-        piece in the preview list, we test-and-place it and
-        '''
-        self.preview_display.clear()
-        for i,t in enumerate(self.preview_list):
-            r = (i*3)+1
-            if t.t_name == T_ShapeNames.O : r -= 1
-            self.preview_display.testAndPlace(
-                new_piece=t, new_col=2, new_row=r )
-            self.preview_display.plant()
+        if self.preview_display.currentPiece() is NO_T_mo :
+            for i,t in enumerate(self.preview_list):
+                self.showPreview(i, t)
+        else :
+            self.preview_display.shiftRowsUp(3)
+            self.showPreview(len(self.preview_list)-1, self.preview_list[-1])
         return next_piece
     '''
+    Draw a piece into slot i of the preview display: test-and-place it and
+    plant it.
+    '''
+    def showPreview(self, i:int, t:T_mo):
+        r = (i*3) + 1 + Game.PreviewRowOffset[t.t_name]
+        self.preview_display.testAndPlace(
+            new_piece=t, new_col=2, new_row=r )
+        self.preview_display.plant()
+    '''
     The current piece is finished, get the next piece. Put it on the board at
-    the middle column and row 1 (second from top). If it won't fit, the game
-    is over.
+    the spawn position, the middle column and row 1 (second from top). If it
+    won't fit, the game is over.
     '''
     def newPiece(self):
         #print('new piece')
         if self.board.testAndPlace(
             new_piece=self.nextPiece(),
-            new_row=1,
-            new_col=self.board.cols//2) == Board.OK :
+            new_row=Game.SpawnRow,
+            new_col=Game.SpawnColumn) == Board.OK :
             return
         self.game_over()
     '''
@@ -1058,20 +1559,23 @@ class Game(QFrame):
     current piece down one line.
 
     If we are waiting after clearing whole lines, the wait is over and it
-    is time to start a new tetronimo. In that case, we need to re-set the
-    timer interval, as it may have been changed while clearing lines.
+    is time to start a new tetronimo. In that case, we may need to re-set the
+    timer interval, as it may have been changed while clearing lines. That
+    happens only on a level change; most pieces land without changing it,
+    and then the running timer is left alone. (QBasicTimer.start() restarts
+    a running timer, so no stop() is needed.)
     '''
     def timerEvent(self, event:QEvent):
         event.accept()
         #print('timer')
         if self.isStarted:
-            self.score_display.setText(str(self.current_score))
             if not self.waitForNextTimer:
                 self.oneLineDown()
             else:
                 self.waitForNextTimer = False
-                self.timer.stop()
-                self.timer.start( self.timeStep, self )
+                if self.timeStep != self.timer_step :
+                    self.timer.start( self.timeStep, self )
+                    self.timer_step = self.timeStep
                 self.newPiece()
         else: # ignore possible timer while processing game_over
             pass
@@ -1079,39 +1583,34 @@ class Game(QFrame):
     === Keystroke Event
 
     Process a key press. Any key press (not release) while the focus is in
-    the board comes here. The key and modifier codes event.key() and
-    event.modifiers(). If the key is in self.validKeys, we can handle the
-    event. Otherwise pass it to our parent.
+    the board comes here. The key code is event.key(), and we OR the keypad
+    bit into it when event.modifiers() includes the keypad modifier. This is
+    done once per event, in plain int arithmetic: event.key() is already an
+    int, and masking the int value of the modifiers is cheaper than a test
+    of the KeyboardModifier flag. If the result is in self.key_action, we can handle
+    the event by calling the method found there, unless it is an
+    auto-repeat of a key in NoRepeatKeys. Otherwise pass it to our parent.
 
-    TODO: right now this is an if/else stack. Could it be converted to
-    a dict lookup for faster performance?
+    Only the keypad modifier matters: Shift, Control etc. are dropped. So a
+    press of the Shift key (which Qt reports with the Shift modifier already
+    set) is seen as plain Key_Shift, the hold key.
 
     '''
     def keyPressEvent(self, event:QEvent):
         if self.isStarted and self.board.currentPiece() is not NO_T_mo :
-            key = int(event.key()) | int(event.modifiers().value)
-            if key in self.validKeys :
+            key = event.key() | (event.modifiers().value & Game.KeypadBit)
+            action = self.key_action.get(key)
+            if action is not None :
                 event.accept() # Tell Qt, we got this one
-                if key in self.Keys_left:
-                    self.moveSideways(toleft=True)
-                elif key in self.Keys_right:
-                    self.moveSideways(toleft=False)
-                elif key in self.Keys_hard_drop:
-                    self.dropDown()
-                elif key in self.Keys_soft_drop:
-                    self.oneLineDown()
-                    self.current_score += 1
-                elif key in self.Keys_clockwise:
-                    self.rotatePiece(toleft=False)
-                elif key in self.Keys_widdershins:
-                    self.rotatePiece(toleft=True)
-                elif key in self.Keys_hold:
-                    self.holdCurrentPiece()
-                elif key in self.Keys_pause:
-                    self.pause()
-        if not event.isAccepted():
-            '''either we are paused or not one of our keys'''
-            super().keyPressEvent(event)
+                if not ( event.isAutoRepeat() and key in Game.NoRepeatKeys ) :
+                    action()
+                return
+        '''
+        Either there is no game in play or it is not one of our keys. A key
+        event arrives already marked accepted, so rather than test that, just
+        pass it on: QWidget's handler ignores it, letting it go to our parent.
+        '''
+        super().keyPressEvent(event)
     '''
     === Move Down
     Move the active T_mo down one line, either because the timer expired
@@ -1123,97 +1622,129 @@ class Game(QFrame):
     testAndPlace when moving down.
     '''
     def oneLineDown(self, move_sound=True):
-        if self.board.testAndPlace(
-            new_piece=self.board.currentPiece(),
-            new_row=self.board.currentRow() + 1,
-            new_col=self.board.currentColumn()) == Board.OK:
+        board = self.board
+        if board.testAndPlace(
+            new_piece=board.currentPiece(),
+            new_row=board.currentRow() + 1,
+            new_col=board.currentColumn()) == Board.OK:
             # translated T_mo is happy where it is, current piece
             # has been updated to new position.
-            if move_sound: self.sfx['move'].play()
+            if move_sound: self.play_move()
             return True
         '''
         Cannot move this piece down, so it has reached its final position,
         so make it a permanent part of the board.
         '''
         self.waitForNextTimer = True
-        self.sfx['settle'].play()
-        self.board.plant()
+        self.play_settle()
+        board.plant()
         '''
         That may have filled one or more rows. Count the lines cleared
         and adjust the timer interval based on how many lines have been cleared.
         '''
-        n = self.board.winnow()
+        n = board.winnow()
         if n :
-            sound = self.sfx['tetris'] if n==4 else self.sfx['line']
-            sound.play()
+            if n == 4 :
+                self.play_tetris()
+            else :
+                self.play_line()
             self.lines_cleared += n
             self.current_level = self.lines_cleared // Game.LinesPerLevel
-            self.current_score += (1+self.current_level)*(100,300,500,800)[n-1]
-            self.lines_display.setText( str(self.lines_cleared) )
-            self.level_display.setText( str(self.current_level) )
-            self.timeStep = max(20,
-                int(Game.StartingSpeed * ( Game.TimeFactor ** self.current_level))
-                               )
+            self.current_score += (1+self.current_level)*Game.LinePoints[n]
+            self.setScores()
+            self.timeStep = Game.StepTimes[
+                min(self.current_level, len(Game.StepTimes)-1) ]
         return False
     '''
+    === Soft Drop
+
+    The user has hit a soft-drop key: move down one line and score a point.
+    '''
+    def softDrop(self):
+        self.oneLineDown()
+        self.addScore(1)
+    '''
+    === Add Score
+
+    Add points to the score and show the new score. Every change of score
+    except a line clear (which shows all the numbers, see setScores()) comes
+    through here, so the score display is updated only when the score moves.
+    '''
+    def addScore(self, points:int):
+        self.current_score += points
+        self.score_display.setValue(self.current_score)
+    '''
     === Drop Down
 
-    The user wants to slam the current piece to the bottom. Move it
-    down repeatedly until it hits bottom.
+    The user wants to slam the current piece to the bottom. Ask the board
+    for the row where the piece will land, and place it there in one step,
+    scoring 2 for each row it falls. Then move it down until it hits bottom:
+    normally that is the one oneLineDown() call that finds it can't move, and
+    plants it. When the board can't give a landing row (the piece is under
+    an overhang), it is the whole drop, one row at a time.
+
+    Board.testAndPlace() only schedules a paint, so the piece is not drawn in
+    the rows it passes through; it simply appears at the bottom.
     Temp: use 'move' noise -- should it be different?
     '''
     def dropDown(self):
-        self.sfx['drop'].play()
-        while self.oneLineDown(move_sound=False) :
-            self.current_score += 2
+        self.play_drop()
+        board = self.board
+        row = board.currentRow()
+        points = 0
+        landing = board.landingRow()
+        if landing is not None and landing > row :
+            if board.testAndPlace(
+                new_piece=board.currentPiece(),
+                new_row=landing,
+                new_col=board.currentColumn()) == Board.OK :
+                points = 2*(landing - row)
+        oneLineDown = self.oneLineDown
+        while oneLineDown(move_sound=False) :
+            points += 2
+        self.addScore(points)
     '''
     === Move Left or Right
 
     The user has hit a key to move the current piece left or right
     '''
     def moveSideways(self, toleft:bool) :
-        X = self.board.currentColumn()-1 if toleft else self.board.currentColumn()+1
-        if self.board.testAndPlace(
-            new_piece=self.board.currentPiece(),
-            new_row=self.board.currentRow(),
+        board = self.board
+        col = board.currentColumn()
+        X = col-1 if toleft else col+1
+        if board.testAndPlace(
+            new_piece=board.currentPiece(),
+            new_row=board.currentRow(),
             new_col=X) == Board.OK :
-            self.sfx['move'].play()
+            self.play_move()
             return True
-        self.sfx['bonk'].play()
+        self.play_bonk()
         return False
     '''
     === Rotate
 
-    The user has hit a key to rotate the current piece.
+    The user has hit a key to rotate the current piece. Try the rotated piece
+    at each of the wall-kick offsets for this shape and rotation in turn (see
+    Wall_Kicks), starting with no offset. The first place it fits is where it
+    goes. If it fits nowhere, the rotation is refused.
     '''
     def rotatePiece(self, toleft:bool ) :
-        new_piece = self.board.currentPiece().rotateLeft() if toleft else \
-                    self.board.currentPiece().rotateRight()
-        result = self.board.testAndPlace(
-            new_piece=new_piece,
-            new_row=self.board.currentRow(),
-            new_col=self.board.currentColumn())
-        if result == Board.LEFT :
-            # rotated piece overlaps left edge of board
-            # try kicking it one place right
-            result = self.board.testAndPlace(
+        board = self.board
+        piece = board.currentPiece()
+        new_piece = piece.rotateLeft() if toleft else piece.rotateRight()
+        row = board.currentRow()
+        col = board.currentColumn()
+        kicks = Wall_Kicks[piece.t_name][(piece.rotation, new_piece.rotation)]
+        for (dc, dr) in kicks :
+            if board.testAndPlace(
                 new_piece=new_piece,
-                new_row=self.board.currentRow(),
-                new_col=self.board.currentColumn()+1 )
-        elif result == Board.RIGHT :
-            # rotated piece overlaps right edge of board,
-            # try kicking it one place left
-            result = self.board.testAndPlace(
-                new_piece=new_piece,
-                new_row=self.board.currentRow(),
-                new_col=self.board.currentColumn()-1 )
-        # if the result (now) is OK, make rotate noise and return
-        if result == Board.OK :
-            self.sfx['rotate'].play()
-            return True
-        else :
-            self.sfx['bonk'].play()
-            return False
+                new_row=row+dr,
+                new_col=col+dc ) == Board.OK :
+                # it fits here, make rotate noise and return
+                self.play_rotate()
+                return True
+        self.play_bonk()
+        return False
     '''
     === Hold
 
@@ -1242,19 +1773,20 @@ class Game(QFrame):
         piece_to_swap_in = self.held_display.currentPiece()
         if piece_to_swap_in is NO_T_mo :
             piece_to_swap_in = self.nextPiece()
-        piece_to_hold = self.board.currentPiece()
-        if self.board.testAndPlace(
+        board = self.board
+        piece_to_hold = board.currentPiece()
+        if board.testAndPlace(
             new_piece=piece_to_swap_in,
-            new_row=self.board.currentRow(),
-            new_col=self.board.currentColumn() ) == Board.OK :
+            new_row=board.currentRow(),
+            new_col=board.currentColumn() ) == Board.OK :
             '''
             Former held piece did fit on the game board, install
             the swapped-out piece in the display.
             '''
-            self.sfx['swap'].play()
+            self.play_swap()
             self.held_display.testAndPlace(piece_to_hold, new_row=2, new_col=2)
         else :
-            self.sfx['bonk'].play()
+            self.play_bonk()
             pass
 
 '''
@@ -1298,13 +1830,15 @@ class Tetris(QMainWindow):
 
         The disadvantage of having one object per sound is, that each one has
         to have its volume adjusted individually.
+
+        Loading happens in the background once setSource() is called, so all
+        nine are started before we wait for any of them (see waitForSFX()
+        below), and they load side by side.
         '''
         def makeSFX( path:str, loop=False ) -> QSoundEffect :
             sfx = QSoundEffect()
             sfx.setSource(QUrl.fromLocalFile(':/'+path))
             sfx.setVolume(0.99)
-            while not sfx.isLoaded():
-                QApplication.instance().processEvents()
             if loop:
                 sfx.setLoopCount(QSoundEffect.Loop.Infinite.value)
             return sfx
@@ -1318,6 +1852,13 @@ class Tetris(QMainWindow):
         self.sfx['swap'] = makeSFX('swap.wav') # hold key
         self.sfx['tetris'] = makeSFX('tetris.wav') # 4-line clear
         self.sfx['theme'] = makeSFX('theme.wav',loop=True) # russalka!
+        self.waitForSFX()
+        '''
+        A tuple of the same objects, for volumeAction() to run through, and
+        the volume it last gave them.
+        '''
+        self.sfx_list = tuple(self.sfx.values())
+        self.sfx_volume = -1.0
         #for (key,sound) in self.sfx.items() :
             #print(key)
             #sound.play()
@@ -1341,26 +1882,31 @@ class Tetris(QMainWindow):
 
         Create the ToolBar and populate it with our actions. Connect
         each action's actionTriggered signal to its relevant slot.
+
+        Load each toolbar icon from the resources once, into a dict by name.
+        The mute button switches between two of them.
         '''
+        self.icons = { name : QIcon(QPixmap(':/icon_{}.png'.format(name)))
+            for name in ('play', 'pause', 'reset', 'mute_on', 'mute_off') }
         self.toolbar = QToolBar()
         self.addToolBar( self.toolbar )
         '''
         Set up the Play icon and connect it to playAction.
         '''
         self.play_action = self.toolbar.addAction(
-            QIcon(QPixmap(':/icon_play.png')),'Play')
+            self.icons['play'],'Play')
         self.play_action.triggered.connect(self.playAction)
         '''
         set up the Pause icon and connect it to pauseAction.
         '''
         self.pause_action = self.toolbar.addAction(
-            QIcon(QPixmap(':/icon_pause.png')),'Pause')
+            self.icons['pause'],'Pause')
         self.pause_action.triggered.connect(self.pauseAction)
         '''
         Set up the Restart icon and connect it to resetAction.
         '''
         self.reset_action = self.toolbar.addAction(
-            QIcon(QPixmap(':/icon_reset.png')),'Reset')
+            self.icons['reset'],'Reset')
         self.reset_action.triggered.connect(self.resetAction)
         '''
         With the control buttons created, set them to enabled or disabled
@@ -1373,9 +1919,7 @@ class Tetris(QMainWindow):
         it remembers its state.
         '''
         self.toolbar.addSeparator()
-        self.mute_on_icon = QIcon(QPixmap(':/icon_mute_on.png'))
-        self.mute_off_icon = QIcon(QPixmap(':/icon_mute_off.png'))
-        self.mute_action = self.toolbar.addAction(self.mute_off_icon,'Mute')
+        self.mute_action = self.toolbar.addAction(self.icons['mute_off'],'Mute')
         self.mute_action.setCheckable(True)
         self.mute_action.triggered.connect(self.muteAction)
 
@@ -1396,11 +1940,33 @@ class Tetris(QMainWindow):
         self.volume_slider.setValue( int(self.settings.value("volume",50)) )
         self.mute_action.setChecked( bool(self.settings.value("mutestate",False)) )
         self.mute_action.setIcon(
-            self.mute_on_icon if self.mute_action.isChecked() else self.mute_off_icon)
+            self.icons['mute_on' if self.mute_action.isChecked() else 'mute_off'])
         self.muted_volume = int(self.settings.value("mutedvol",self.volume_slider.value()) )
         self.volumeAction(self.volume_slider.value())
 
 
+    '''
+    === Wait for SFX
+
+    Wait until every sound effect has finished loading, or failed to. Rather
+    than spin calling processEvents(), run a local event loop, and have each
+    sound's statusChanged signal check whether all are done, and if so,
+    quit the loop.
+    '''
+    def waitForSFX(self):
+        event_loop = QEventLoop()
+        def allDone() -> bool :
+            return all( sfx.isLoaded() or sfx.status() == QSoundEffect.Status.Error
+                        for sfx in self.sfx.values() )
+        def checkDone():
+            if allDone() :
+                event_loop.quit()
+        for sfx in self.sfx.values() :
+            sfx.statusChanged.connect(checkDone)
+        if not allDone() :
+            event_loop.exec()
+        for sfx in self.sfx.values() :
+            sfx.statusChanged.disconnect(checkDone)
     '''
     === Control tool button state
 
@@ -1442,13 +2008,34 @@ class Tetris(QMainWindow):
     '''
     === Reset button
 
+    Ask the user to confirm the reset. QMessageBox.question() would run a
+    nested event loop until answered, with the game timer still firing
+    behind it. Instead, pause the game if it is running, and open() the
+    box, which is modal to our window but returns at once. Its finished
+    signal brings the answer to resetAnswer(), along with whether we paused
+    the game here. On Yes, start a new game; otherwise resume the game if we
+    paused it.
     '''
     def resetAction(self, toggled:bool):
-        ans = QMessageBox.question(
-            self, 'Reset clicked', 'Reset the game? State will be lost.' )
-        if ans == QMessageBox.StandardButton.Ok or ans == QMessageBox.StandardButton.Yes :
+        paused_here = self.game.isStarted and not self.game.isPaused
+        if paused_here :
+            self.game.pause()
+        self.enableButtons()
+        box = QMessageBox( QMessageBox.Icon.Question, 'Reset clicked',
+            'Reset the game? State will be lost.',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self )
+        box.setAttribute( Qt.WidgetAttribute.WA_DeleteOnClose )
+        box.finished.connect( functools.partial(self.resetAnswer, paused_here) )
+        box.open()
+
+    def resetAnswer(self, paused_here:bool, result:int):
+        if result == QMessageBox.StandardButton.Yes.value :
             self.game.clear()
             self.game.start()
+        elif paused_here :
+            self.game.pause() # toggle back to running
+        self.enableButtons()
     '''
     === Volume change and Mute
 
@@ -1458,20 +2045,33 @@ class Tetris(QMainWindow):
 
     Set the value on each of the QSoundEffect objects we own. Note that the
     QSoundEffect.setVolume() method wants a real, but the slider value is an int.
+
+    A drag of the slider signals every step of the way, so while the slider
+    is held down, a change of less than 0.02 from the volume last set is
+    skipped. When the slider is released, sliderAction sets the exact value.
+    Whether dragging or not, a volume equal to the one last set is skipped:
+    after most drags, the release would otherwise set the same value again.
     '''
     def volumeAction(self, slider_value:int ) :
         real_volume = slider_value/100.0
-        for sfx in self.sfx.values() :
+        change = abs(real_volume - self.sfx_volume)
+        if change == 0.0 \
+        or ( change < 0.02 and self.volume_slider.isSliderDown() ) :
+            return
+        self.sfx_volume = real_volume
+        for sfx in self.sfx_list :
             sfx.setVolume( real_volume )
     '''
     This action is called only when the user has dragged the volume slider
     and released it. The volumeAction volume change signal that calls
-    volumeAction occurs separately; here we just want to release the Mute
-    button if it is checked. N.B. calling setChecked does not cause the
-    triggered signal that would invoke muteAction below.
+    volumeAction occurs separately; here we want to release the Mute
+    button if it is checked, and make sure the volume that was last skipped
+    during the drag, if any, is set. N.B. calling setChecked does not cause
+    the triggered signal that would invoke muteAction below.
     '''
     def sliderAction(self):
         self.mute_action.setChecked(False)
+        self.volumeAction(self.volume_slider.value())
     '''
     This slot is called when the Mute button is clicked by the user. The Mute
     button action is checkable, and checked is the new state, on or off.
@@ -1482,11 +2082,11 @@ class Tetris(QMainWindow):
     '''
     def muteAction(self, checked:bool):
         if checked :
-            self.mute_action.setIcon(self.mute_on_icon)
+            self.mute_action.setIcon(self.icons['mute_on'])
             self.muted_volume = self.volume_slider.value()
             self.volume_slider.setValue(0) # triggers entry to volumeAction
         else :
-            self.mute_action.setIcon(self.mute_off_icon)
+            self.mute_action.setIcon(self.icons['mute_off'])
             self.volume_slider.setValue(self.muted_volume)
     '''
     === Close Event
@@ -1496,9 +2096,14 @@ class Tetris(QMainWindow):
 
     Note: it is not best design to fetch the possibly-changed high score by
     reaching into the game object, assuming it has a high_score attribute.
+
+    The same six keys are written every time, so each simply replaces its
+    old value. There is no need to clear() the settings first, which would
+    only make QSettings delete every key and write them all again. Nor do we
+    sync() here: QSettings writes its changes when it is destroyed, after the
+    window has gone, so closing the window doesn't wait on the disk.
     '''
     def closeEvent(self, event:QEvent):
-        self.settings.clear()
         self.settings.setValue("windowSize",self.size())
         self.settings.setValue("windowPosition",self.pos())
         self.settings.setValue("highScore",self.game.high_score)
@@ -1511,12 +2116,8 @@ class Tetris(QMainWindow):
 '''
 == Program Start and Initialization
 
-Process command-line arguments if any,
-
-* TODO: decide on command parameters to support if any
-* TODO: if any, define command parameters with argparse
-
-(Temporary: initialize the random seed from argv[1] if given)
+Process command-line arguments with argparse. The only one so far is an
+optional integer seed for the random generator, so a game can be replayed.
 
 * Initialize the QApplication.
 * Load binary resources (sounds, icons)
@@ -1527,14 +2128,15 @@ Process command-line arguments if any,
 
 if __name__ == '__main__' :
     '''
-    Temporary: Initialize the random seed from the command line if there is
-    an argument and it is convertable to int. Otherwise don't.
+    Initialize the random seed from the command line if there is an
+    argument. argparse rejects one that is not an int, with a usage message.
+    Without one, the seed is None and random.seed() uses system entropy.
     '''
-    import sys
-    try :
-        random.seed( int( sys.argv[1] ) )
-    except : # whatever...
-        random.seed()
+    import argparse
+    parser = argparse.ArgumentParser( description='Play Tetris.' )
+    parser.add_argument( 'seed', type=int, nargs='?', default=None,
+                         help='seed for the random generator' )
+    random.seed( parser.parse_args().seed )
     '''
     Initialize the QT app.
     '''
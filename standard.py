@@ -23,6 +23,7 @@ from PyQt6.QtCore import (
     Qt,
     QBasicTimer,
     QEvent,
+    QLine,
     pyqtSignal
     )
 from PyQt6.QtGui import (
@@ -78,6 +79,13 @@ T_Colors = {
     T_ShapeNames.Z : QColor('red')
     }
 '''
+The lighter and darker shades of each color, used to draw the outline of
+a cell. QColor.lighter() and darker() return a new QColor on every call,
+so make them once here rather than for every cell of every paint.
+'''
+T_Lighter = { t_name : color.lighter() for (t_name, color) in T_Colors.items() }
+T_Darker = { t_name : color.darker() for (t_name, color) in T_Colors.items() }
+'''
 Assigning each Tetronimoe its shape and initial orientation.
 
 Per the guidelines, quote,
@@ -153,18 +161,43 @@ When drawing the active T_mo, the Board adds the actual row and column index
 to the relative values of the T_mo shape.
 
 A T_mo can rotate, but note that the rotate_left() and rotate_right() methods
-do NOT modify shape of the called T_mo. They return a NEW T_mo intended to
-replace this one. This is done so that the Board can test a rotation. If the
-new, rotated T_mo is legal, it replaces the old; but if it is not permitted,
-the original T_mo is left unchanged.
+do NOT modify shape of the called T_mo. They return a DIFFERENT T_mo intended
+to replace this one. This is done so that the Board can test a rotation. If
+the new, rotated T_mo is legal, it replaces the old; but if it is not
+permitted, the original T_mo is left unchanged.
+
+A T_mo never changes once made, so there need be only one of each shape in
+each of its four rotations. Those are made once, in T_mo_Rotations below,
+and rotating a T_mo returns another of them, so play makes no new T_mos.
+T_mo declares its attributes in __slots__, which makes it smaller and a
+little quicker to read.
 
 '''
 
 class T_mo(object):
-    def __init__(self, t_name: T_ShapeNames) :
+    __slots__ = ('t_name', 't_color', 'coords', 'rotation',
+                 '_x_min', '_x_max', '_y_min', '_y_max')
+
+    def __init__(self, t_name: T_ShapeNames, coords: tuple = None,
+                 rotation: int = 0) :
         self.t_name = t_name
         self.t_color = T_Colors[t_name]
-        self.coords = tuple( ((x,y) for (x,y) in T_Shapes[t_name]) )
+        '''
+        T_Shapes values are tuples of tuples, immutable, so the new T_mo can
+        share one rather than copy it. A rotated T_mo passes its own coords,
+        and its rotation, 0-3, the number of right turns from T_Shapes.
+        '''
+        self.coords = T_Shapes[t_name] if coords is None else coords
+        self.rotation = rotation
+        '''
+        The coords of a T_mo never change, so work out its extrema once, here.
+        '''
+        xs = [x for (x,y) in self.coords]
+        ys = [y for (x,y) in self.coords]
+        self._x_min = min(xs)
+        self._x_max = max(xs)
+        self._y_min = min(ys)
+        self._y_max = max(ys)
 
     def color(self) -> QColor :
         return self.t_color
@@ -182,35 +215,45 @@ class T_mo(object):
     used to compute collisions.
     '''
     def x_max(self) -> int :
-        return max( (x for (x,y) in self.coords) )
+        return self._x_max
     def x_min(self) -> int :
-        return min( (x for (x,y) in self.coords) )
+        return self._x_min
     def y_max(self) -> int :
-        return max( (y for (x,y) in self.coords) )
+        return self._y_max
     def y_min(self) -> int :
-        return min( (y for (x,y) in self.coords) )
+        return self._y_min
 
     '''
-    Return a new T_mo with its shape rotated either left or right. Note that
-    we cannot type-declare these methods as "-> T_mo", because when these
-    lines are executed, the name T_mo has not been defined yet! Little flaw
-    in the Python typing system.
+    Return the T_mo of this shape rotated either left or right, from
+    T_mo_Rotations. Note that we cannot type-declare these methods as
+    "-> T_mo", because when these lines are executed, the name T_mo has not
+    been defined yet! Little flaw in the Python typing system.
     '''
     def rotateLeft(self) :
-        new_tmo = T_mo( self.t_name )
-        new_tmo.coords = tuple( ((-y,x) for (x,y) in self.coords ) )
-        return new_tmo
+        return T_mo_Rotations[self.t_name][(self.rotation - 1) % 4]
     def rotateRight(self) :
-        new_tmo = T_mo( self.t_name )
-        new_tmo.coords = tuple( ( (y,-x) for (x,y) in self.coords ) )
-        return new_tmo
+        return T_mo_Rotations[self.t_name][(self.rotation + 1) % 4]
+
+'''
+Make the four T_mos of one shape, in rotations 0 to 3, each one turned right
+from the one before.
+'''
+def make_rotations(t_name: T_ShapeNames) -> typing.Tuple[T_mo, ...] :
+    coords = T_Shapes[t_name]
+    rotations = []
+    for rotation in range(4):
+        rotations.append( T_mo( t_name, coords, rotation ) )
+        coords = tuple( ( (y,-x) for (x,y) in coords ) )
+    return tuple(rotations)
+
+T_mo_Rotations = { t_name : make_rotations(t_name) for t_name in T_ShapeNames }
 
 '''
 This global instance of T_mo is the only one of type N. It is
 referenced from any unoccupied board cell.
 '''
 
-NO_T_mo = T_mo( T_ShapeNames.N )
+NO_T_mo = T_mo_Rotations[T_ShapeNames.N][0]
 
 '''
 Define the game board. This is where the game is implemented.
@@ -342,7 +385,7 @@ class Board(QFrame):
         '''
         if 0 == len(self.bag) :
             self.bag = make_bag()
-        self.curPiece = T_mo( self.bag.pop() )
+        self.curPiece = T_mo_Rotations[ self.bag.pop() ][0]
 
         self.curX = Board.Columns // 2 + 1
         self.curY = Board.Rows - 2 + self.curPiece.y_min()
@@ -609,29 +652,42 @@ class Board(QFrame):
         '''
         Called by the Qt app when it thinks this QFrame should be updated,
         the paintEvent() method is responsible for drawing all shapes of the game.
+
+        The cell size is fetched once, not for every cell, and the board
+        list is walked in a single loop. Cell i of the list is at x, y =
+        i % Columns, i // Columns, with y counting up from the bottom; the
+        pixel positions of each row and column are worked out before the loop.
         '''
         painter = QPainter(self)
         rect = self.contentsRect()
-        boardTop = rect.bottom() - Board.Rows * self.cellHeight()
+        w = self.cellWidth()
+        h = self.cellHeight()
+        boardTop = rect.bottom() - Board.Rows * h
+        xs = [rect.left() + x * w for x in range(Board.Columns)]
+        ys = [boardTop + (Board.Rows - y - 1) * h for y in range(Board.Rows)]
 
-        for i in range(Board.Rows):
-            for j in range(Board.Columns):
-                self.drawSquare(painter,
-                                rect.left() + j * self.cellWidth(),
-                                boardTop + i * self.cellHeight(),
-                                self.shapeAt(j, Board.Rows - i - 1))
+        '''
+        Collect the cells by shape name, so that each color is drawn in one
+        batch by drawSquares(), with its pens set once rather than per cell.
+        '''
+        groups = dict() # type: Dict[T_ShapeNames, List[Tuple[int,int]]]
+        for (i, shape) in enumerate(self.board):
+            y, x = divmod(i, Board.Columns)
+            groups.setdefault(shape.t_name, []).append( (xs[x], ys[y]) )
+        for (t_name, points) in groups.items():
+            self.drawSquares(painter, points, w, h, t_name)
 
         if self.curPiece is not NO_T_mo:
             '''
-            Draw the active tetronimo around the current cell.
+            Draw the active tetronimo around the current cell, over the
+            empty cells drawn above. Its cells' pixel positions come straight
+            from its coords and the row and column positions above.
             '''
-            for i in range(4):
-                x = self.curX + self.curPiece.x(i)
-                y = self.curY + self.curPiece.y(i)
-                self.drawSquare(painter,
-                                rect.left() + x * self.cellWidth(),
-                                boardTop + (Board.Rows - y - 1) * self.cellHeight(),
-                                self.curPiece)
+            curX = self.curX
+            curY = self.curY
+            points = [ (xs[curX + x], ys[curY + y])
+                       for (x, y) in self.curPiece.coords ]
+            self.drawSquares(painter, points, w, h, self.curPiece.t_name)
 
     def cellWidth(self) -> int :
         '''
@@ -649,32 +705,38 @@ class Board(QFrame):
         '''
         return self.contentsRect().height() // Board.Rows
 
-    def drawSquare(self, painter:QPainter, x:int, y:int, shape:T_mo):
+    def drawSquares(self, painter:QPainter, points:typing.List[typing.Tuple[int,int]],
+                    w:int, h:int, t_name:T_ShapeNames):
         '''
-        Draw one cell of the board with the color of the tetronimo
-        that is in that cell. The T_mo knows its own QColor.
+        Draw some cells of the board, each w by h pixels with its top left at
+        one of the (x, y) points, all in the color of the tetronimo t_name.
 
-        First, paint a rectangle inset 1 pixel from the cell boundary in
+        First, paint a rectangle inset 1 pixel from each cell boundary in
         the T_mo's color.
         '''
-        color = shape.color()
-        painter.fillRect(x + 1, y + 1, self.cellWidth() - 2,
-            self.cellHeight() - 2, color)
-
-        '''
-        Then, give the rectangle a "drop shadow" outline, lighter on two
-        sides and darker on two, using the very convenient lighter/darker
-        methods of the QColor class.
-        '''
-        painter.setPen(color.lighter())
-        painter.drawLine(x, y + self.cellHeight() - 1, x, y)
-        painter.drawLine(x, y, x + self.cellWidth() - 1, y)
-
-        painter.setPen(color.darker())
-        painter.drawLine(x + 1, y + self.cellHeight() - 1,
-            x + self.cellWidth() - 1, y + self.cellHeight() - 1)
-        painter.drawLine(x + self.cellWidth() - 1,
-            y + self.cellHeight() - 1, x + self.cellWidth() - 1, y + 1)
+        color = T_Colors[t_name]
+        for (x, y) in points:
+            painter.fillRect(x + 1, y + 1, w - 2, h - 2, color)
+
+        '''
+        Then, give the rectangles a "drop shadow" outline, lighter on two
+        sides and darker on two, using the shades prepared in T_Lighter and
+        T_Darker. Each pen is set once, and all the lines in it are drawn in
+        one call.
+        '''
+        painter.setPen(T_Lighter[t_name])
+        lines = []
+        for (x, y) in points:
+            lines.append( QLine(x, y + h - 1, x, y) )
+            lines.append( QLine(x, y, x + w - 1, y) )
+        painter.drawLines(lines)
+
+        painter.setPen(T_Darker[t_name])
+        lines = []
+        for (x, y) in points:
+            lines.append( QLine(x + 1, y + h - 1, x + w - 1, y + h - 1) )
+            lines.append( QLine(x + w - 1, y + h - 1, x + w - 1, y + 1) )
+        painter.drawLines(lines)
 
 '''
         Define the main window.